@@ -0,0 +1,61 @@
+"""
+Benchmark - sequential suppress() loop vs bulk_remove()
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from contextlib import suppress
+
+from cleanup import bulk_remove
+
+# tmpfs keeps the disk out of the measurement
+TMPFS = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def create_files(directory, n, per_directory=10_000):
+    paths = []
+    for i in range(n):
+        subdirectory = os.path.join(directory, f"shard_{i // per_directory}")
+        if i % per_directory == 0:
+            os.makedirs(subdirectory)
+        path = os.path.join(subdirectory, f"cache_{i}.tmp")
+        open(path, "w").close()
+        paths.append(path)
+    return paths
+
+
+def suppress_loop(paths):
+    """Example 2 from main.py, at cache-eviction scale"""
+    for file in paths:
+        with suppress(FileNotFoundError):
+            os.remove(file)
+
+
+def cleanup_benchmark(n=100_000):
+    print("Sequential suppress() loop vs bulk_remove()")
+    print("=" * 60)
+    print(f"\n{n:,} files on {TMPFS or tempfile.gettempdir()}\n")
+
+    runs = [
+        ("suppress() loop", lambda root, paths: suppress_loop(paths)),
+        ("bulk_remove, 1 thread", lambda root, paths: bulk_remove(root, workers=1)),
+        ("bulk_remove, 8 threads", lambda root, paths: bulk_remove(root, workers=8)),
+    ]
+    for label, run in runs:
+        root = tempfile.mkdtemp(dir=TMPFS)
+        try:
+            paths = create_files(root, n)
+            start = time.perf_counter()
+            summary = run(root, paths)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28} {elapsed:7.2f} s   {n / elapsed:10,.0f} files/s")
+            if summary is not None:
+                print(f"{'':<28} {summary}")
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    cleanup_benchmark()
@@ -0,0 +1,242 @@
+"""
+Bulk file cleanup
+
+The temp-file loop removes one file at a time inside suppress(), and the
+suppressed errors are gone for good. bulk_remove() scans directories with
+os.scandir, deletes in batches on a bounded thread pool (unlink relative to
+an open directory fd where the platform supports it), still suppresses the
+expected errors per file, and returns a per-error-type summary.
+"""
+
+import fnmatch
+import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+BATCH_SIZE = 512
+
+# unlinkat(): no path resolution from the root for every file
+_UNLINK_AT = os.unlink in os.supports_dir_fd
+_FD_WALK = _UNLINK_AT and os.scandir in os.supports_fd and hasattr(os, "O_NOFOLLOW")
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+
+class CleanupSummary:
+    """What a cleanup removed, and what went wrong per error type"""
+
+    def __init__(self, max_samples=5):
+        self.removed = 0
+        self.suppressed = Counter()
+        self.errors = Counter()
+        self.samples = {}
+        self.max_samples = max_samples
+
+    @property
+    def ok(self):
+        """True when every failure was an expected (suppressed) one"""
+        return not self.errors
+
+    def record(self, counter, path, exc):
+        name = type(exc).__name__
+        counter[name] += 1
+        samples = self.samples.setdefault(name, [])
+        if len(samples) < self.max_samples:
+            samples.append(path)
+
+    def merge(self, other):
+        self.removed += other.removed
+        self.suppressed.update(other.suppressed)
+        self.errors.update(other.errors)
+        for name, paths in other.samples.items():
+            samples = self.samples.setdefault(name, [])
+            samples.extend(paths[: self.max_samples - len(samples)])
+
+    def as_dict(self):
+        return {
+            "removed": self.removed,
+            "suppressed": dict(self.suppressed),
+            "errors": dict(self.errors),
+            "samples": self.samples,
+        }
+
+    def __repr__(self):
+        return f"CleanupSummary(removed={self.removed}, suppressed={dict(self.suppressed)}, errors={dict(self.errors)})"
+
+
+def _record(summary, expected, path, exc):
+    summary.record(summary.suppressed if isinstance(exc, expected) else summary.errors, path, exc)
+
+
+def _remove_batch(directory, names, expected, max_samples, dir_fd=None):
+    """Unlink names inside one directory, never raising OSError
+
+    dir_fd is the directory as opened by the scan; the batch owns it and
+    closes it. Without one the directory is opened by path.
+    """
+    summary = CleanupSummary(max_samples)
+    if dir_fd is None and _UNLINK_AT:
+        try:
+            dir_fd = os.open(directory, _DIR_FLAGS)
+        except OSError as exc:
+            # The whole directory is gone or unreadable, every name fails the same way
+            for name in names:
+                _record(summary, expected, os.path.join(directory, name), exc)
+            return summary
+
+    try:
+        for name in names:
+            try:
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    os.unlink(os.path.join(directory, name))
+                summary.removed += 1
+            except expected as exc:
+                summary.record(summary.suppressed, os.path.join(directory, name), exc)
+            except OSError as exc:
+                summary.record(summary.errors, os.path.join(directory, name), exc)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return summary
+
+
+def _scan(root, pattern, recursive, summary, expected):
+    """Yield (directory, names, dir_fd) batches of matching files
+
+    Directories that can't be listed are recorded in summary, split into
+    expected and unexpected errors like the deletes.
+    """
+    if _FD_WALK:
+        yield from _scan_fds(root, pattern, recursive, summary, expected)
+        return
+
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        names = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif pattern is None or fnmatch.fnmatch(entry.name, pattern):
+                        names.append(entry.name)
+                        if len(names) == BATCH_SIZE:
+                            yield directory, names, None
+                            names = []
+        except OSError as exc:
+            # Gone between listing and scanning it, or not readable
+            _record(summary, expected, directory, exc)
+        if names:
+            yield directory, names, None
+
+
+def _scan_fds(root, pattern, recursive, summary, expected):
+    """_scan() through directory fds instead of paths
+
+    Subdirectories are opened relative to their parent with O_NOFOLLOW and
+    each batch unlinks through a dup of the fd it was listed from, so a
+    directory swapped for a symlink mid-run can't redirect the deletes.
+    """
+    try:
+        root_fd = os.open(root, _DIR_FLAGS)
+    except OSError as exc:
+        _record(summary, expected, root, exc)
+        return
+
+    # (path, fd, subdirectory names left): one open fd per level, not per pending directory
+    stack = [(root, root_fd, None)]
+    try:
+        while stack:
+            directory, fd, subdirs = stack[-1]
+            if subdirs is None:
+                subdirs = []
+                try:
+                    yield from _list_fd(directory, fd, pattern, recursive, subdirs)
+                except OSError as exc:
+                    _record(summary, expected, directory, exc)
+                stack[-1] = (directory, fd, iter(subdirs))
+                continue
+
+            name = next(subdirs, None)
+            if name is None:
+                stack.pop()
+                os.close(fd)
+                continue
+            try:
+                child = os.open(name, _DIR_FLAGS | os.O_NOFOLLOW, dir_fd=fd)
+            except OSError as exc:
+                _record(summary, expected, os.path.join(directory, name), exc)
+                continue
+            stack.append((os.path.join(directory, name), child, None))
+    finally:
+        for _, fd, _ in stack:
+            os.close(fd)
+
+
+def _list_fd(directory, fd, pattern, recursive, subdirs):
+    names = []
+    with os.scandir(fd) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirs.append(entry.name)
+            elif pattern is None or fnmatch.fnmatch(entry.name, pattern):
+                names.append(entry.name)
+                if len(names) == BATCH_SIZE:
+                    yield directory, names, os.dup(fd)
+                    names = []
+    if names:
+        yield directory, names, os.dup(fd)
+
+
+def _run(batches, workers, expected, max_samples):
+    summary = CleanupSummary(max_samples)
+    expected = tuple(expected)
+    if workers <= 1:
+        for directory, names, dir_fd in batches:
+            summary.merge(_remove_batch(directory, names, expected, max_samples, dir_fd))
+        return summary
+
+    # Bounded: scanning never gets more than 2 batches per worker ahead
+    in_flight = deque()
+    with ThreadPoolExecutor(workers) as pool:
+        for directory, names, dir_fd in batches:
+            in_flight.append(pool.submit(_remove_batch, directory, names, expected, max_samples, dir_fd))
+            if len(in_flight) >= workers * 2:
+                summary.merge(in_flight.popleft().result())
+        while in_flight:
+            summary.merge(in_flight.popleft().result())
+    return summary
+
+
+def bulk_remove(root, pattern=None, recursive=True, workers=8, expected=(FileNotFoundError,), max_samples=5):
+    """Delete files under root (optionally matching a glob like '*.tmp')
+
+    Directories are left in place. Errors in `expected` are suppressed per
+    file; any other OSError is counted too instead of aborting the run.
+    Directories that can't be scanned (including a missing root) are
+    counted the same way, with the directory as the sample path.
+    """
+    expected = tuple(expected)
+    scanned = CleanupSummary(max_samples)
+    summary = _run(_scan(os.fspath(root), pattern, recursive, scanned, expected), workers, expected, max_samples)
+    summary.merge(scanned)
+    return summary
+
+
+def remove_files(paths, workers=8, expected=(FileNotFoundError,), max_samples=5):
+    """Delete an explicit list of files, grouped by directory"""
+    by_directory = {}
+    for path in map(os.fspath, paths):
+        directory, name = os.path.split(path)
+        by_directory.setdefault(directory or os.curdir, []).append(name)
+
+    batches = (
+        (directory, names[i:i + BATCH_SIZE], None)
+        for directory, names in by_directory.items()
+        for i in range(0, len(names), BATCH_SIZE)
+    )
+    return _run(batches, workers, expected, max_samples)
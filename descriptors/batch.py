@@ -0,0 +1,155 @@
+"""
+Batch validation for descriptor-validated models
+
+Building one BankAccount per row checks one field at a time and raises on the
+first error. validate_columns() reuses the same declarations (PositiveNumber,
+validated Fields) but checks each column in one pass, collects every error
+into a compact report and only then builds the valid objects.
+
+Any descriptor with a `check_column(values, rows=None)` method takes part,
+like PositiveNumber, whose rules live in its `validator`.
+"""
+
+import gc
+from array import array
+from functools import cache
+from itertools import compress
+
+
+class ValidationReport:
+    """All errors of a batch, grouped by field and message"""
+
+    def __init__(self, total):
+        self.total = total
+        # (field, error type, message) -> failing row indices
+        self.errors = {}
+
+    def add(self, field, error, message, indices):
+        rows = self.errors.setdefault((field, error.__name__, message), array("q"))
+        rows.extend(indices)
+
+    @property
+    def invalid_rows(self):
+        return sorted(set().union(*self.errors.values()))
+
+    @property
+    def invalid_count(self):
+        return len(self.invalid_rows)
+
+    @property
+    def valid_count(self):
+        return self.total - self.invalid_count
+
+    def summary(self, samples=5):
+        """One entry per distinct error, with a few example rows"""
+        return [
+            {
+                "field": field,
+                "error": error,
+                "message": message,
+                "count": len(rows),
+                "rows": rows[:samples].tolist(),
+            }
+            for (field, error, message), rows in self.errors.items()
+        ]
+
+    def __bool__(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"ValidationReport(total={self.total}, invalid={self.invalid_count}, errors={len(self.errors)})"
+
+
+def _declarations(cls):
+    """(field name, column checker) for every validated field"""
+    fields = getattr(cls, "__fields__", None)
+    if fields is not None:
+        return [(name, field.check_column) for name, field in fields.items()]
+
+    declarations = []
+    for klass in reversed(cls.__mro__):
+        for name, descriptor in vars(klass).items():
+            check_column = getattr(descriptor, "check_column", None)
+            if callable(check_column):
+                declarations.append((name, check_column))
+    return declarations
+
+
+def validate_columns(cls, columns):
+    """Check every declared column of `cls`, return a ValidationReport
+
+    Declared fields without a column are skipped: load_valid() leaves them to
+    __init__, which applies their default (or reports the missing argument).
+    """
+    total = len(next(iter(columns.values()), ()))
+    report = ValidationReport(total)
+    for name, check_column in _declarations(cls):
+        if name not in columns:
+            continue
+        values = columns[name]
+        if len(values) != total:
+            raise ValueError(f"column {name!r} has {len(values)} rows, expected {total}")
+        for error, message, indices in check_column(values):
+            report.add(name, error, message, indices)
+    return report
+
+
+def load_valid(cls, columns):
+    """Validate whole columns, then build only the valid objects
+
+    Objects are built with cls(**row), one keyword per column, so __init__
+    runs as usual. If it still rejects a row the declarations didn't cover,
+    the error is added to the report under the "__init__" field. The cyclic
+    GC is paused while building: millions of new acyclic objects would
+    otherwise trigger collections that find nothing.
+    """
+    report = validate_columns(cls, columns)
+    build = _make_builder(cls, tuple(columns))
+
+    valid = bytearray(b"\x01") * report.total
+    for index in report.invalid_rows:
+        valid[index] = 0
+    rows = enumerate(zip(*map(_as_list, columns.values())))
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        objects, failed = build(compress(rows, valid))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    for index, exc in failed:
+        report.add("__init__", type(exc), str(exc), [index])
+    return objects, report
+
+
+@cache
+def _make_builder(cls, names):
+    """Compile a loop calling cls(name=value, ...) for every row"""
+    for name in names:
+        if not name.isidentifier():
+            raise ValueError(f"column {name!r} is not a valid keyword argument")
+    # Loop variables are numbered dunder names, never a column name
+    values = [f"__build_v{i}__" for i in range(len(names))]
+    target = f"({''.join(f'{value}, ' for value in values)})"
+    call = ", ".join(f"{name}={value}" for name, value in zip(names, values))
+    source = "\n".join([
+        "def build(__build_rows__):",
+        "    __build_objects__, __build_failed__ = [], []",
+        "    __build_append__ = __build_objects__.append",
+        f"    for __build_index__, {target} in __build_rows__:",
+        "        try:",
+        f"            __build_append__(__build_cls__({call}))",
+        "        except (TypeError, ValueError) as __build_exc__:",
+        "            __build_failed__.append((__build_index__, __build_exc__))",
+        "    return __build_objects__, __build_failed__",
+    ])
+    env = {"__build_cls__": cls}
+    exec(source, env)
+    return env["build"]
+
+
+def _as_list(values):
+    # NumPy columns become Python numbers, like the per-object path
+    return values.tolist() if hasattr(values, "tolist") else values
@@ -0,0 +1,110 @@
+"""
+Benchmarks - PositiveNumber descriptor vs compiled validated fields
+"""
+
+import time
+import tracemalloc
+
+from batch import load_valid
+from main import BankAccount
+from validated import positive_number, validated
+
+
+@validated
+class SlottedAccount:
+    """Same rules as BankAccount, compiled by @validated"""
+
+    balance = positive_number(default=0)
+
+    def deposit(self, amount):
+        self.balance += amount
+
+    def withdraw(self, amount):
+        self.balance -= amount
+
+
+def timed(label, func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<44} {best * 1000:9.2f} ms")
+    return best
+
+
+def bytes_per_instance(build, n=100_000):
+    tracemalloc.start()
+    objects = build(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / n
+
+
+def validated_fields_benchmark(n=1_000_000):
+    print("Descriptor vs compiled validated fields")
+    print("=" * 60)
+
+    balances = [float(i % 1000) for i in range(n)]
+    rows = [(balance,) for balance in balances]
+
+    print(f"\nConstruct {n:,} objects:")
+    timed("BankAccount(balance)", lambda: [BankAccount(b) for b in balances])
+    timed("SlottedAccount(balance)", lambda: [SlottedAccount(b) for b in balances])
+    timed("SlottedAccount.validate_many(rows)", lambda: SlottedAccount.validate_many(rows))
+
+    descriptor, slotted = BankAccount(100), SlottedAccount(100)
+    print(f"\nRead .balance {n:,} times:")
+    timed("BankAccount", lambda: [descriptor.balance for _ in range(n)])
+    timed("SlottedAccount", lambda: [slotted.balance for _ in range(n)])
+
+    print(f"\ndeposit() {n:,} times:")
+    timed("BankAccount", lambda: [descriptor.deposit(1) for _ in range(n)])
+    timed("SlottedAccount", lambda: [slotted.deposit(1) for _ in range(n)])
+
+    print("\nMemory per instance (tracemalloc):")
+    for label, cls in [("BankAccount", BankAccount), ("SlottedAccount", SlottedAccount)]:
+        size = bytes_per_instance(lambda count: [cls(1.5) for _ in range(count)])
+        print(f"{label:<44} {size:9.0f} bytes")
+
+
+def batch_validation_benchmark(n=1_000_000, invalid_every=100):
+    print("\n\nPer-object construction vs batch validation")
+    print("=" * 60)
+
+    # 1% of the rows are invalid, half wrong type and half negative
+    balances = [
+        ("n/a" if i % (2 * invalid_every) == 0 else -1.0) if i % invalid_every == 0 else float(i % 1000)
+        for i in range(n)
+    ]
+    print(f"\n{n:,} rows, {n // invalid_every:,} invalid:")
+
+    def per_object():
+        accounts, errors = [], []
+        for index, balance in enumerate(balances):
+            try:
+                accounts.append(BankAccount(balance))
+            except (TypeError, ValueError) as exc:
+                errors.append((index, exc))
+        return accounts, errors
+
+    def batch():
+        return load_valid(BankAccount, {"balance": balances})
+
+    (accounts, errors), (loaded, report) = per_object(), batch()
+    assert len(accounts) == len(loaded) == report.valid_count
+    assert len(errors) == report.invalid_count
+
+    for label, func in [("BankAccount() per row + try/except", per_object), ("load_valid(BankAccount, columns)", batch)]:
+        elapsed = timed(label, func)
+        print(f"{'':<44} {n / elapsed:9,.0f} rows/s")
+
+    print("\nReport:")
+    for entry in report.summary(samples=3):
+        print(f"  {entry['field']}: {entry['error']} {entry['message']!r} x{entry['count']:,} (rows {entry['rows']})")
+
+
+if __name__ == "__main__":
+    validated_fields_benchmark()
+    batch_validation_benchmark()
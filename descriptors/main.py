@@ -2,12 +2,18 @@
 Python Descriptors for Reusable Attribute Validation
 """
 
+from validated import Range, Type, compile_check
+
 
 class PositiveNumber:
     """Descriptor that validates positive numbers"""
 
+    # One definition for single values and for whole columns (batch.py)
+    validator = Type(int, float, label="number") & Range(min=0)
+
     def __set_name__(self, owner, name):
         self.name = f"_{name}"
+        self.check = compile_check(self.validator, name)
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -15,12 +21,13 @@ class PositiveNumber:
         return getattr(instance, self.name, 0)
 
     def __set__(self, instance, value):
-        if not isinstance(value, (int, float)):
-            raise TypeError(f"Expected number, got {type(value).__name__}")
-        if value < 0:
-            raise ValueError(f"{self.name[1:]} cannot be negative")
+        self.check(value)
         setattr(instance, self.name, value)
 
+    def check_column(self, values, rows=None):
+        """Check a whole column, see Validator.check_column()"""
+        return self.validator.check_column(self.name[1:], values, rows)
+
 
 class BankAccount:
     """Bank account with validated balance"""
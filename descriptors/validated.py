@@ -0,0 +1,359 @@
+"""
+Code-generated validated fields
+
+PositiveNumber stores values in the instance __dict__ and every read goes
+through __get__ + getattr. @validated does the work once per class instead,
+the way dataclasses does: values live in __slots__, and __init__, the setters
+and a bulk validate_many() are compiled with exec() with the checks inlined.
+"""
+
+import operator
+import re
+
+try:
+    import numpy as np
+except ImportError:  # Columns are checked with plain comprehensions
+    np = None
+
+MISSING = object()
+
+
+class Validator:
+    """Base class: check() for one value, lines() for the generated code"""
+
+    def check(self, name, value):
+        raise NotImplementedError
+
+    def lines(self, var, name, env):
+        """Source lines that validate `var`; globals they need go in env"""
+        raise NotImplementedError
+
+    def check_column(self, name, values, rows=None):
+        """Check a whole column without raising
+
+        Only the `rows` indices are checked (None = every row). Returns
+        (error type, message, failing indices) groups.
+        """
+        groups = {}
+        for i in _row_indices(values, rows):
+            try:
+                self.check(name, values[i])
+            except (TypeError, ValueError) as exc:
+                groups.setdefault((type(exc), str(exc)), []).append(i)
+        return [(error, message, indices) for (error, message), indices in groups.items()]
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+
+class AllOf(Validator):
+    """Run several validators in order"""
+
+    def __init__(self, *validators):
+        self.validators = []
+        for validator in validators:
+            # Flatten chains built with &
+            if isinstance(validator, AllOf):
+                self.validators.extend(validator.validators)
+            else:
+                self.validators.append(validator)
+
+    def check(self, name, value):
+        for validator in self.validators:
+            validator.check(name, value)
+
+    def lines(self, var, name, env):
+        return [line for validator in self.validators for line in validator.lines(var, name, env)]
+
+    def check_column(self, name, values, rows=None):
+        # A row only reports its first failure, like the per-object checks
+        failures = []
+        for validator in self.validators:
+            found = validator.check_column(name, values, rows)
+            if found:
+                failed = set().union(*(indices for _, _, indices in found))
+                rows = [i for i in _row_indices(values, rows) if i not in failed]
+                failures += found
+        return failures
+
+
+class Type(Validator):
+    def __init__(self, *types, label=None):
+        self.types = types
+        self.label = label or " or ".join(t.__name__ for t in types)
+
+    def check(self, name, value):
+        if not isinstance(value, self.types):
+            raise TypeError(f"Expected {self.label}, got {type(value).__name__}")
+
+    def lines(self, var, name, env):
+        # Builtins are bound too, a field may well be called `type`
+        types, isinstance_, type_ = _bind(env, self.types), _bind(env, isinstance), _bind(env, type)
+        prefix = f"Expected {self.label}, got "
+        return [
+            f"if not {isinstance_}({var}, {types}):",
+            f"    raise TypeError({prefix!r} + {type_}({var}).__name__)",
+        ]
+
+    def check_column(self, name, values, rows=None):
+        if _is_array(values):
+            # One dtype for the whole column, no need to look at each value
+            if values.dtype.kind in "iuf":
+                accepted = {int} if values.dtype.kind in "iu" else {float}
+                if accepted & set(self.types):
+                    return []
+            values = values.tolist()
+
+        types, groups = self.types, {}
+        # Inlined comprehensions, this loop runs once per row
+        if rows is None:
+            failing = [i for i, value in enumerate(values) if not isinstance(value, types)]
+        else:
+            failing = [i for i in rows if not isinstance(values[i], types)]
+        for i in failing:
+            groups.setdefault(type(values[i]).__name__, []).append(i)
+        return [
+            (TypeError, f"Expected {self.label}, got {got}", indices)
+            for got, indices in groups.items()
+        ]
+
+
+class Range(Validator):
+    def __init__(self, min=None, max=None):
+        self.min = min
+        self.max = max
+
+    def _below_min(self, name):
+        if self.min == 0:
+            return f"{name} cannot be negative"
+        return f"{name} must be at least {self.min}"
+
+    def check(self, name, value):
+        if self.min is not None and value < self.min:
+            raise ValueError(self._below_min(name))
+        if self.max is not None and value > self.max:
+            raise ValueError(f"{name} must be at most {self.max}")
+
+    def lines(self, var, name, env):
+        lines = []
+        if self.min is not None:
+            lines += [
+                f"if {var} < {_bind(env, self.min)}:",
+                f"    raise ValueError({self._below_min(name)!r})",
+            ]
+        if self.max is not None:
+            lines += [
+                f"if {var} > {_bind(env, self.max)}:",
+                f"    raise ValueError({f'{name} must be at most {self.max}'!r})",
+            ]
+        return lines
+
+    def check_column(self, name, values, rows=None):
+        failures = []
+        try:
+            if self.min is not None:
+                failures += _compare_column(values, rows, operator.lt, self.min, self._below_min(name))
+            if self.max is not None:
+                message = f"{name} must be at most {self.max}"
+                failures += _compare_column(values, rows, operator.gt, self.max, message)
+        except TypeError:
+            # Some value can't be compared ("x", None): check row by row
+            # so those rows get the same TypeError that check() raises
+            return super().check_column(name, values, rows)
+        return failures
+
+
+class Regex(Validator):
+    def __init__(self, pattern):
+        self.pattern = re.compile(pattern)
+
+    def check(self, name, value):
+        if self.pattern.fullmatch(value) is None:
+            raise ValueError(f"{name} does not match {self.pattern.pattern!r}")
+
+    def lines(self, var, name, env):
+        fullmatch = _bind(env, self.pattern.fullmatch)
+        message = f"{name} does not match {self.pattern.pattern!r}"
+        return [
+            f"if {fullmatch}({var}) is None:",
+            f"    raise ValueError({message!r})",
+        ]
+
+    def check_column(self, name, values, rows=None):
+        fullmatch = self.pattern.fullmatch
+        try:
+            indices = _failing(values, rows, lambda value: fullmatch(value) is None)
+        except TypeError:
+            # A non-string value, report it per row like check() would
+            return super().check_column(name, values, rows)
+        if not indices:
+            return []
+        return [(ValueError, f"{name} does not match {self.pattern.pattern!r}", indices)]
+
+
+class Field:
+    """Declare a validated attribute; @validated turns it into a slot"""
+
+    def __init__(self, *validators, default=MISSING):
+        self.validator = AllOf(*validators)
+        self.default = default
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    @property
+    def slot(self):
+        # Not "_name": "__name" would be mangled and "_x" may be another field
+        return f"{self.name}__slot"
+
+    def check(self, value):
+        self.validator.check(self.name, value)
+
+    def check_column(self, values, rows=None):
+        return self.validator.check_column(self.name, values, rows)
+
+
+def positive_number(default=MISSING):
+    """Same rules as the PositiveNumber descriptor"""
+    return Field(Type(int, float, label="number"), Range(min=0), default=default)
+
+
+def _row_indices(values, rows):
+    return range(len(values)) if rows is None else rows
+
+
+def _failing(values, rows, fails):
+    """Indices of the checked rows where fails(value) is true"""
+    if rows is None:
+        return [i for i, value in enumerate(values) if fails(value)]
+    return [i for i in rows if fails(values[i])]
+
+
+def _is_array(values):
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _compare_column(values, rows, compare, bound, message):
+    if _is_array(values) and rows is None:
+        indices = np.flatnonzero(compare(values, bound)).tolist()
+    elif rows is None:
+        indices = [i for i, value in enumerate(values) if compare(value, bound)]
+    else:
+        indices = [i for i in rows if compare(values[i], bound)]
+    return [(ValueError, message, indices)] if indices else []
+
+
+def _bind(env, value):
+    """Make `value` available to generated code and return its global name"""
+    name = f"__validated_v{len(env)}__"
+    env[name] = value
+    return name
+
+
+def _check_names(cls, fields):
+    # Generated code only uses dunder names of its own, fields must not
+    for field in fields:
+        if field.name.startswith("__") and field.name.endswith("__"):
+            raise TypeError(f"{cls.__qualname__}.{field.name}: dunder names cannot be fields")
+    # The property would replace the slot descriptor of the other field
+    names = {field.name for field in fields}
+    for field in fields:
+        if field.slot in names:
+            raise TypeError(f"{cls.__qualname__}.{field.slot}: field name clashes with the slot of {field.name!r}")
+
+
+def _compile(name, source, env, qualname):
+    exec(source, env)
+    func = env[name]
+    func.__qualname__ = qualname
+    return func
+
+
+def compile_check(validator, name):
+    """validator.check(name, value) as one function with the checks inlined"""
+    env = {}
+    lines = validator.lines("__validated_value__", name, env)
+    source = "\n".join([
+        "def check(__validated_value__):",
+        *(f"    {line}" for line in lines or ["pass"]),
+    ])
+    return _compile("check", source, env, f"check_{name}")
+
+
+def _checks(field, var, env, indent):
+    return [f"{indent}{line}" for line in field.validator.lines(var, field.name, env)]
+
+
+def _make_init(cls, fields):
+    env = {}
+    params, body, seen_default = ["__validated_self__"], [], False
+    for field in fields:
+        if field.default is MISSING:
+            if seen_default:
+                raise TypeError(f"non-default field {field.name!r} follows default field")
+            params.append(field.name)
+        else:
+            seen_default = True
+            params.append(f"{field.name}={_bind(env, field.default)}")
+        body += _checks(field, field.name, env, "    ")
+        # Write the slot directly, the checks already ran
+        body.append(f"    __validated_self__.{field.slot} = {field.name}")
+
+    source = "\n".join([f"def __init__({', '.join(params)}):", *(body or ["    pass"])])
+    return _compile("__init__", source, env, f"{cls.__qualname__}.__init__")
+
+
+def _make_setter(cls, field):
+    env = {}
+    source = "\n".join([
+        "def setter(__validated_self__, __validated_value__):",
+        *_checks(field, "__validated_value__", env, "    "),
+        f"    __validated_self__.{field.slot} = __validated_value__",
+    ])
+    return _compile("setter", source, env, f"{cls.__qualname__}.{field.name}")
+
+
+def _make_validate_many(cls, fields):
+    env = {"__validated_new__": object.__new__}
+    target = f"({''.join(f'{field.name}, ' for field in fields)})"
+    body = []
+    for field in fields:
+        body += _checks(field, field.name, env, "        ")
+    body += ["        __validated_self__ = __validated_new__(__validated_cls__)"]
+    body += [f"        __validated_self__.{field.slot} = {field.name}" for field in fields]
+    # Locals are dunder names so any field name can be a loop variable
+    source = "\n".join([
+        "def validate_many(__validated_cls__, __validated_rows__):",
+        "    __validated_objects__ = []",
+        "    __validated_append__ = __validated_objects__.append",
+        f"    for {target} in __validated_rows__:",
+        *body,
+        "        __validated_append__(__validated_self__)",
+        "    return __validated_objects__",
+    ])
+    return classmethod(_compile("validate_many", source, env, f"{cls.__qualname__}.validate_many"))
+
+
+def validated(cls):
+    """Class decorator: __slots__ storage plus compiled __init__ and setters"""
+    fields = [value for value in vars(cls).values() if isinstance(value, Field)]
+    _check_names(cls, fields)
+
+    namespace = {
+        key: value
+        for key, value in vars(cls).items()
+        if key not in ("__dict__", "__weakref__") and not isinstance(value, Field)
+    }
+    namespace["__slots__"] = tuple(field.slot for field in fields)
+    namespace["__fields__"] = {field.name: field for field in fields}
+
+    # __slots__ must exist when the class is created, so build a new one
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+
+    new_cls.__init__ = _make_init(new_cls, fields)
+    new_cls.validate_many = _make_validate_many(new_cls, fields)
+    for field in fields:
+        setattr(new_cls, field.name, property(operator.attrgetter(field.slot), _make_setter(new_cls, field)))
+    return new_cls
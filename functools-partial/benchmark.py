@@ -0,0 +1,109 @@
+"""
+Benchmarks - lambda vs partial vs specialized callables
+"""
+
+import os
+import tempfile
+import time
+from functools import partial
+from operator import mul
+
+from logger import LEVELS, BatchWriter, LoggerFactory
+from specialize import map_batched, specialize, vectorized
+
+
+class tagged(partial):
+    """A partial subclass, the kind partial() does not flatten"""
+
+
+def timed(label, func, n, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:9.2f} ms   {n / best / 1e6:6.2f} M items/s")
+
+
+def specialize_benchmark(n=1_000_000, chunk_size=100_000):
+    print("Specialized partials")
+    print("=" * 60)
+
+    hex_numbers = [format(i, "x") for i in range(n)]
+    chunks = [hex_numbers[i:i + chunk_size] for i in range(0, n, chunk_size)]
+    numbers = list(range(n))
+
+    parse_hex = partial(int, base=16)
+    nested = partial(tagged(int, base=10), base=16)
+    fast_hex = vectorized(parse_hex)
+
+    print(f"\nParse {n:,} hex strings:")
+    timed("lambda", lambda: list(map(lambda x: int(x, base=16), hex_numbers)), n)
+    timed("partial(int, base=16)", lambda: list(map(parse_hex, hex_numbers)), n)
+    timed("nested partial + keyword override", lambda: list(map(nested, hex_numbers)), n)
+    timed("specialize(nested, arity=1)", lambda: list(map(specialize(nested, arity=1), hex_numbers)), n)
+    if fast_hex is not None:
+        timed("vectorized (NumPy)", lambda: [fast_hex(chunk) for chunk in chunks], n)
+    timed("map_batched, inline", lambda: list(map_batched(parse_hex, chunks, workers=0)), n)
+    timed("map_batched, 4 processes", lambda: list(map_batched(parse_hex, chunks, workers=4)), n)
+
+    multiply_by_10 = partial(mul, 10)
+    fast_mul = vectorized(multiply_by_10)
+
+    print(f"\nMultiply {n:,} numbers by 10:")
+    timed("lambda", lambda: list(map(lambda x: x * 10, numbers)), n)
+    timed("partial(mul, 10)", lambda: list(map(multiply_by_10, numbers)), n)
+    timed("specialize(partial(mul, 10), arity=1)", lambda: list(map(specialize(multiply_by_10, arity=1), numbers)), n)
+    if fast_mul is not None:
+        timed("vectorized (NumPy)", lambda: fast_mul(numbers), n)
+
+
+def logger_benchmark(n=1_000_000, emitted=200_000):
+    print("\n\nLevel-bound loggers")
+    print("=" * 60)
+
+    devnull = open(os.devnull, "w")
+    threshold = LEVELS["INFO"]
+
+    def filtered_log(level, message):
+        # The usual fix: check the level inside the function
+        if LEVELS[level] >= threshold:
+            print(f"[{level}] {message}", file=devnull)
+
+    factory = LoggerFactory("INFO", writer=BatchWriter(devnull))
+    user = "alice"
+
+    print(f"\nDisabled DEBUG call, {n:,} times:")
+    log_debug = partial(filtered_log, "DEBUG")
+    timed("partial(filtered_log, 'DEBUG') + f-string", lambda: [log_debug(f"User {user} logged in") for _ in range(n)], n)
+    log_debug = factory.bind("DEBUG")
+    timed("factory.bind('DEBUG'), deferred args", lambda: [log_debug("User %s logged in", user) for _ in range(n)], n)
+    timed("empty loop (baseline)", lambda: [None for _ in range(n)], n)
+
+    print(f"\nEmitted INFO messages to a file, {emitted:,} times:")
+    with tempfile.TemporaryFile("w") as output:
+        def log_to_file(level, message):
+            print(f"[{level}] {message}", file=output, flush=True)
+
+        log_info = partial(log_to_file, "INFO")
+        timed("partial(log, 'INFO') + print", lambda: [log_info(f"User {user} logged in") for _ in range(emitted)], emitted)
+
+        file_factory = LoggerFactory("INFO", writer=BatchWriter(output))
+        log_info = file_factory.bind("INFO")
+        timed("factory.bind('INFO'), caller side only", lambda: [log_info("User %s logged in", user) for _ in range(emitted)], emitted)
+
+        def end_to_end():
+            for _ in range(emitted):
+                log_info("User %s logged in", user)
+            file_factory.writer.flush()
+
+        timed("factory.bind('INFO'), written + flushed", end_to_end, emitted)
+        file_factory.writer.close()
+
+    factory.writer.close()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    specialize_benchmark()
+    logger_benchmark()
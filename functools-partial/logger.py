@@ -0,0 +1,178 @@
+"""
+Level-bound loggers built with partial
+
+`partial(log, "ERROR")` formats and prints every message right away. A
+LoggerFactory hands out the same kind of level-bound callables, but:
+
+- Filtered-out levels get a shared no-op function, so a disabled call costs
+  one empty function call and never formats anything
+- Enabled levels only queue (level, message, args); formatting and writing
+  happen in batches on a background thread, so asyncio code never blocks on I/O
+
+Because formatting is deferred, args are formatted as they are when the
+writer gets to them, not as they were at the call. Pass immutable values
+(or a copy) for objects that keep changing after the call.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import queue
+import sys
+import threading
+import traceback
+from functools import partial
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _disabled(message, *args):
+    """Stands in for every filtered-out level"""
+
+
+def format_record(level, message, args):
+    """Same output as log(level, message), with %-style args applied lazily
+
+    Never raises: a bad format string, a failing __str__ or an argument
+    mutated by another thread while formatting must not kill the writer.
+    """
+    if args:
+        try:
+            message = message % args
+        except Exception as exc:
+            try:
+                message = f"{message} {args!r}"
+            except Exception:
+                message = f"{message} <unformattable args: {type(exc).__name__}: {exc}>"
+    return f"[{level}] {message}\n"
+
+
+class BatchWriter:
+    """Write queued records from a background thread, many per write()"""
+
+    def __init__(self, stream=None, batch_size=512):
+        self.stream = stream or sys.stdout
+        self.batch_size = batch_size
+        # SimpleQueue.put never blocks, safe to call from the event loop
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, level, message, *args):
+        self._queue.put((level, message, args))
+
+    def _run(self):
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        while True:
+            # Block for the first record, then drain whatever else is queued
+            records = [get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(get_nowait())
+                except queue.Empty:
+                    break
+
+            lines, events, stop = [], [], False
+            for record in records:
+                if record is _STOP:
+                    stop = True
+                elif isinstance(record, tuple) and record[0] is _FLUSH:
+                    events.append(record[1])
+                else:
+                    lines.append(format_record(*record))
+
+            try:
+                if lines:
+                    self.stream.write("".join(lines))
+                    self.stream.flush()
+            except Exception:
+                # Like logging's handleError(): report it, drop the batch, keep running
+                self._report_error()
+            finally:
+                # flush() waiters are released even if the batch was lost
+                for event in events:
+                    event.set()
+            if stop:
+                return
+
+    def _report_error(self):
+        if self.stream is not sys.stderr and sys.stderr is not None:
+            with contextlib.suppress(Exception):
+                sys.stderr.write("--- Logging error in log-writer ---\n")
+                traceback.print_exc(file=sys.stderr)
+
+    def flush(self):
+        """Block until everything queued so far has been written"""
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+
+    async def aflush(self):
+        await asyncio.to_thread(self.flush)
+
+    def close(self):
+        """Stop the writer thread; later records are written synchronously"""
+        if isinstance(self._queue, _DirectWrite):
+            return
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        # emit() looks the queue up on every call, so bound loggers switch
+        # over too; records that raced with the stop are written, not dropped
+        pending, self._queue = self._queue, _DirectWrite(self)
+        while True:
+            try:
+                self._queue.put(pending.get_nowait())
+            except queue.Empty:
+                break
+        atexit.unregister(self.close)
+
+
+class _DirectWrite:
+    """Stands in for the queue of a closed BatchWriter"""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def put(self, record):
+        if record is _STOP:
+            return
+        if isinstance(record, tuple) and record[0] is _FLUSH:
+            record[1].set()
+            return
+        try:
+            self.writer.stream.write(format_record(*record))
+            self.writer.stream.flush()
+        except Exception:
+            self.writer._report_error()
+
+
+class LoggerFactory:
+    """Create level-bound log functions, like partial(log, level)
+
+    log_error = factory.bind("ERROR")
+    log_error("Payment %s failed", payment_id)
+
+    The threshold is applied when binding: call bind() again after changing
+    `level` to pick up the new setting.
+    """
+
+    def __init__(self, level="INFO", writer=None):
+        self.level = level
+        self.writer = writer or BatchWriter()
+
+    def enabled(self, level):
+        return LEVELS[level] >= LEVELS[self.level]
+
+    def bind(self, level):
+        if level not in LEVELS:
+            raise ValueError(f"Unknown level {level!r}, expected one of {list(LEVELS)}")
+        if not self.enabled(level):
+            return _disabled
+        return partial(self.writer.emit, level)
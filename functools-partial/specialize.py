@@ -0,0 +1,255 @@
+"""
+Specialized partials for hot map pipelines
+
+partial() already flattens a partial of a plain partial, but subclasses and
+wrappers stay nested, and every call still merges the stored keywords into a
+fresh dict. specialize() flattens the chain once and compiles a fixed-arity
+function with the pre-filled arguments inlined (keywords become positional
+when the signature allows it). map_batched() runs chunks in a process pool
+and uses a NumPy fast path for the cases that have one.
+"""
+
+import inspect
+import operator
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+
+try:
+    import numpy as np
+except ImportError:  # No vectorized fast paths
+    np = None
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+# Builtins without an introspectable signature: positional parameter names
+_POSITIONAL_PARAMETERS = {
+    int: ("x", "base"),
+}
+
+
+def flatten(func):
+    """Collapse nested partials into one (func, args, keywords) triple"""
+    args, keywords = (), {}
+    while isinstance(func, partial):
+        # Outer arguments come after inner ones, outer keywords win
+        args = func.args + args
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+    return func, args, keywords
+
+
+def _positional_parameters(func):
+    if func in _POSITIONAL_PARAMETERS:
+        return _POSITIONAL_PARAMETERS[func]
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    names = []
+    for parameter in parameters:
+        if parameter.kind not in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            break
+        names.append(parameter.name)
+    return tuple(names)
+
+
+def _compile(func, args, keywords, arity):
+    env = {"_func": func}
+    call = [f"_a{i}" for i in range(len(args))]
+    env.update(zip(call, args))
+    params = [f"x{i}" for i in range(arity)]
+    call += params
+
+    # Keywords that land on the next positional slots are passed positionally
+    keywords = dict(keywords)
+    positional = _positional_parameters(func)
+    while len(call) < len(positional) and positional[len(call)] in keywords:
+        name = f"_k{len(call)}"
+        env[name] = keywords.pop(positional[len(call)])
+        call.append(name)
+    for key, value in keywords.items():
+        env[f"_kw_{key}"] = value
+        call.append(f"{key}=_kw_{key}")
+
+    source = f"def specialized({', '.join(params)}):\n    return _func({', '.join(call)})"
+    exec(source, env)
+    specialized = env["specialized"]
+    specialized.__qualname__ = f"specialized({getattr(func, '__name__', func)!s})"
+    return specialized
+
+
+def specialize(func, arity=None):
+    """Flatten `func` and compile it for calls with exactly `arity` arguments
+
+    Without an arity, or without keywords, the result is a single flat
+    partial. The last 256 results are cached per (function, arguments,
+    keywords, arity), typed like lru_cache(typed=True): 10 and 10.0 are
+    different entries.
+    """
+    target, args, keywords = flatten(func)
+    items = tuple(sorted(keywords.items()))
+    try:
+        hash((target, args, items))
+    except TypeError:  # Unhashable pre-filled arguments, can't be cached
+        return _specialize(target, args, items, arity)
+    types = (tuple(map(type, args)), tuple(type(value) for _, value in items))
+    return _cached_specialize(target, args, items, types, arity)
+
+
+@lru_cache(maxsize=256)
+def _cached_specialize(target, args, items, types, arity):
+    # `types` is only part of the cache key
+    return _specialize(target, args, items, arity)
+
+
+def _specialize(target, args, items, arity):
+    keywords = dict(items)
+    # A flat partial with positional arguments only is already a C-level
+    # call, compiling only pays off when there are keywords to merge
+    if arity is None or not keywords or not all(keyword.isidentifier() for keyword in keywords):
+        return partial(target, *args, **keywords)
+    return _compile(target, args, keywords, arity)
+
+
+def _parse_int_array(strings, base):
+    """Vectorized int(s, base) for plain ASCII digits, None if it can't tell"""
+    # int() rejects bytes and numbers once a base is given, leave them to it
+    if not _all_of_type(strings, str, "U"):
+        return None
+    try:
+        raw = np.array(strings, dtype="S")
+    except UnicodeEncodeError:
+        return None
+    width = raw.dtype.itemsize
+    # int64 must hold the widest value
+    if not len(raw) or base ** width > 2 ** 63:
+        return None
+
+    digits = _DIGITS[raw.view(np.uint8).reshape(len(raw), width)]
+    # -1 marks the NUL padding after shorter strings
+    padding = digits < 0
+    if (digits >= base).any() or padding[:, 0].any() or (padding[:, :-1] & ~padding[:, 1:]).any():
+        return None
+
+    result = np.zeros(len(raw), dtype=np.int64)
+    for column, pad in zip(digits.T, padding.T):
+        result = np.where(pad, result, result * base + column)
+    return result
+
+
+def _scalar_operation(op, scalar, values):
+    """Vectorized op(scalar, value) for numbers that fit int64/float64"""
+    # A mixed chunk would be upcast to float64: [1, 2.5] * 10 must stay [10, 25.0]
+    if not (_all_of_type(values, int, "iu") or _all_of_type(values, float, "f")):
+        return None
+    array = np.asarray(values)
+    if not len(array):
+        return None
+    if array.dtype.kind == "u" and array.max() > np.iinfo(np.int64).max:
+        return None
+    # Compute like Python numbers: int32 wraps at 2**31 and uint8 - 1 wraps
+    # to 255, int64/float64 hold what the bounds below allow
+    array = array.astype(np.int64 if array.dtype.kind in "iu" else np.float64, copy=False)
+    if op is operator.truediv and not array.all():
+        # Leave ZeroDivisionError to the per-item path instead of inf/nan
+        return None
+    if array.dtype.kind == "i":
+        # abs() of the int64 minimum overflows, compare in float instead
+        largest = max(abs(float(array.min())), abs(float(array.max())))
+        if op is operator.truediv:
+            # int / int is rounded once by Python, float64 conversion must be exact
+            if largest > 2 ** 53 or (isinstance(scalar, int) and abs(scalar) > 2 ** 53):
+                return None
+        elif isinstance(scalar, int):
+            # Python ints never overflow, int64 does
+            bound = largest * abs(scalar) if op is operator.mul else largest + abs(scalar)
+            if bound >= 2 ** 62:
+                return None
+    return _UFUNCS[op](scalar, array)
+
+
+def _all_of_type(values, kind, dtype_kinds):
+    """True if every value is exactly `kind` (or an array of a matching dtype)"""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.dtype.kind in dtype_kinds
+    return set(map(type, values)) <= {kind}
+
+
+if np is not None:
+    _DIGITS = np.full(256, 99, dtype=np.int16)
+    _DIGITS[0] = -1
+    _DIGITS[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+    _DIGITS[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)] = np.arange(10, 36)
+    _DIGITS[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)] = np.arange(10, 36)
+
+    _UFUNCS = {
+        operator.add: np.add,
+        operator.sub: np.subtract,
+        operator.mul: np.multiply,
+        operator.truediv: np.true_divide,
+    }
+
+
+def vectorized(func):
+    """NumPy version of `func` that takes a whole chunk, or None
+
+    Covers partial(int, base=b) and a binary operator with one bound
+    argument such as partial(mul, 10).
+    """
+    if np is None:
+        return None
+    target, args, keywords = flatten(func)
+
+    if target is int and not args and set(keywords) <= {"base"}:
+        base = keywords.get("base", 10)
+        if 2 <= base <= 36:
+            return partial(_parse_int_array, base=base)
+
+    if target in _UFUNCS and len(args) == 1 and not keywords and type(args[0]) in (int, float):
+        return partial(_scalar_operation, target, args[0])
+
+    return None
+
+
+def _apply_chunk(func, chunk):
+    """Map one chunk, vectorized when possible"""
+    fast = vectorized(func)
+    if fast is not None and (result := fast(chunk)) is not None:
+        return result.tolist()
+    return list(map(specialize(func, arity=1), chunk))
+
+
+def map_batched(func, chunks, workers=None, executor="process", max_in_flight=None):
+    """Yield func applied to each chunk, one list per chunk
+
+    Chunks run in a process pool by default (func must be picklable, which
+    partials of module-level functions are). workers=0 runs them inline.
+    At most max_in_flight chunks (default 2 per worker) are submitted ahead,
+    so `chunks` can be a lazy generator over a large input.
+    """
+    if workers == 0:
+        yield from (_apply_chunk(func, chunk) for chunk in chunks)
+        return
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {sorted(_EXECUTORS)}, got {executor!r}")
+
+    # Ship the flat partial, compiled functions don't pickle
+    target, args, keywords = flatten(func)
+    flat = partial(target, *args, **keywords)
+    max_in_flight = max_in_flight or 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    with _EXECUTORS[executor](workers) as pool:
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_apply_chunk, flat, chunk))
+                # Results come back in input order; wait for the oldest when full
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Closed early: don't start the chunks still queued
+            for future in pending:
+                future.cancel()
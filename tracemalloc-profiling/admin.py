@@ -0,0 +1,50 @@
+"""
+Admin endpoints for the tracemalloc leak monitor
+"""
+from typing import Optional
+
+import uvicorn
+from fastapi import APIRouter, FastAPI
+
+from leak_monitor import LeakMonitor
+
+
+def create_admin_router(monitor: LeakMonitor) -> APIRouter:
+    """Expose a LeakMonitor under /admin/memory"""
+    router = APIRouter(prefix="/admin/memory", tags=["admin"])
+
+    @router.get("")
+    def memory_report():
+        """Growing allocation sites and recent snapshot diffs"""
+        # Sync handler: runs in the threadpool, never on the event loop
+        return monitor.report()
+
+    @router.post("/start")
+    def start_monitor(interval: Optional[float] = None, frames: Optional[int] = None):
+        """Start tracing at runtime (fewer frames = less overhead)"""
+        monitor.start(interval=interval, frames=frames)
+        return monitor.report()
+
+    @router.post("/stop")
+    def stop_monitor():
+        """Stop tracing and drop the last snapshot"""
+        monitor.stop()
+        return monitor.report()
+
+    @router.post("/sample")
+    def take_sample():
+        """Take a snapshot now instead of waiting for the next interval"""
+        # Sync handlers run in the threadpool, snapshots never block the loop
+        return {"diff": monitor.sample()}
+
+    return router
+
+
+monitor = LeakMonitor(interval=30.0, frames=1)
+
+app = FastAPI()
+app.include_router(create_admin_router(monitor))
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=8000)
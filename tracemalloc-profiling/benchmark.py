@@ -0,0 +1,131 @@
+"""
+Benchmarks - memory and speed of the alternatives to Example 1 and 2
+"""
+
+import time
+import tracemalloc
+
+from pipeline import Pipeline
+from record_store import RecordStore
+
+N = 100_000
+
+
+def measure(label, build):
+    """Return what build() created, with its tracemalloc-measured footprint"""
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} current {current / 1024 / 1024:7.2f} MB   peak {peak / 1024 / 1024:7.2f} MB")
+    return result, current
+
+
+def timed(label, func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:8.2f} ms")
+    return best
+
+
+def build_dicts():
+    return [{"id": i, "value": i * 2, "name": f"item_{i}"} for i in range(N)]
+
+
+def build_store():
+    store = RecordStore({"id": "q", "value": "q", "name": str})
+    store.extend({"id": i, "value": i * 2, "name": f"item_{i}"} for i in range(N))
+    return store
+
+
+def record_store_benchmark():
+    print("Record store vs list of dicts")
+    print("=" * 60)
+    print(f"\n{N:,} rows of {{'id', 'value', 'name'}}\n")
+
+    dicts, dict_bytes = measure("list of dicts", build_dicts)
+    store, store_bytes = measure("RecordStore", build_store)
+    print(f"\nBytes per row: dicts {dict_bytes / N:.0f}, store {store_bytes / N:.0f} "
+          f"({dict_bytes / store_bytes:.1f}x smaller)\n")
+
+    def sum_dicts():
+        return sum(row["value"] for row in dicts)
+
+    def sum_rows():
+        return sum(row.value for row in store)
+
+    def sum_tuples():
+        return sum(value for (value,) in store.rows("value"))
+
+    def sum_column():
+        return store.sum("value")
+
+    def filter_dicts():
+        return [row for row in dicts if row["value"] > N]
+
+    def filter_store():
+        return store.filter("value", ">", N)
+
+    assert sum_dicts() == sum_rows() == sum_tuples() == sum_column()
+    assert len(filter_dicts()) == len(filter_store())
+
+    timed("iterate dicts (row['value'])", sum_dicts)
+    timed("iterate row views (row.value)", sum_rows)
+    timed("iterate tuples (store.rows)", sum_tuples)
+    timed("aggregate column (store.sum)", sum_column)
+    timed("filter dicts", filter_dicts)
+    timed("filter store (vectorized)", filter_store)
+
+
+def square(x):
+    return x * x
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def total(batch):
+    return sum(batch)
+
+
+def pipeline_benchmark(n=1_000_000):
+    print("\n\nPipeline vs materialized lists")
+    print("=" * 60)
+    print(f"\nsquare -> keep evens -> sum batches of 1000, {n:,} items\n")
+
+    def with_lists():
+        squares = [square(i) for i in range(n)]
+        evens = [x for x in squares if is_even(x)]
+        batches = [evens[i:i + 1000] for i in range(0, len(evens), 1000)]
+        return sum(total(batch) for batch in batches)
+
+    def with_pipeline(**pool):
+        pipeline = Pipeline(range(n)).map(square).filter(is_even).batch(1000).map(total, **pool)
+        return sum(pipeline), pipeline
+
+    for label, run in [
+        ("materialized lists", with_lists),
+        ("pipeline", with_pipeline),
+        ("pipeline, 4 threads", lambda: with_pipeline(workers=4, max_in_flight=8)),
+    ]:
+        measure(label, run)
+        # Timed separately, tracing slows every allocation down
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{'':<28} {n / elapsed:,.0f} items/s")
+
+    _, pipeline = with_pipeline(workers=4, max_in_flight=8)
+    print("\nPer-stage metrics (4 threads):")
+    for stage in pipeline.metrics():
+        print(f"  {stage['stage']:<28} {stage['items_per_second']:>14,.0f} items/s   "
+              f"max in flight {stage['max_in_flight']}")
+
+
+if __name__ == "__main__":
+    record_store_benchmark()
+    pipeline_benchmark()
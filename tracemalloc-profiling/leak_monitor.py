@@ -0,0 +1,214 @@
+"""
+tracemalloc - Continuous Leak Detection
+
+Take periodic snapshots in a background thread, diff each one against the
+previous snapshot and flag allocation sites that keep growing.
+"""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+
+class LeakMonitor:
+    """Background monitor that diffs tracemalloc snapshots over time"""
+
+    def __init__(
+        self,
+        interval=60.0,
+        frames=1,
+        history=20,
+        growth_intervals=3,
+        include=None,
+        exclude=None,
+        top=10,
+    ):
+        self.interval = interval
+        self.frames = frames
+        self.growth_intervals = growth_intervals
+        self.top = top
+        # Only trace our own code by default (the directory of the running app)
+        self.include = list(include or [os.getcwd()])
+        # An app in a virtualenv under cwd would otherwise report its
+        # dependencies (and the stdlib) as its own allocations
+        self.exclude = list(exclude if exclude is not None else _default_exclude(self.include))
+        self.history = deque(maxlen=history)
+
+        self._lock = threading.Lock()
+        # Serializes start()/stop(); separate from _lock, which sample() takes
+        # while stop() joins the sampler thread
+        self._control = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._started_tracing = False
+        self._previous = None
+        self._streaks = {}
+        self._samples = 0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def key_type(self):
+        # Grouping by a single line is cheaper; full stacks need 'traceback'
+        return "lineno" if self.frames == 1 else "traceback"
+
+    def start(self, interval=None, frames=None):
+        """Start tracing and sampling in the background
+
+        If tracemalloc is already tracing, its traceback limit is kept and
+        `frames` reports that limit instead of the requested one.
+        """
+        with self._control:
+            if self.running:
+                return
+            if interval is not None:
+                self.interval = interval
+            if frames is not None:
+                self.frames = frames
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracing = True
+            self.frames = tracemalloc.get_traceback_limit()
+
+            with self._lock:
+                # Stop/start leaves a gap, growth must be proven again
+                self._streaks = {}
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="leak-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop sampling and release tracemalloc if we started it"""
+        with self._control:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+            with self._lock:
+                # A snapshot holds a copy of every trace, don't keep it around
+                self._previous = None
+
+    def _run(self):
+        self.sample()
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def _filters(self):
+        filters = [
+            tracemalloc.Filter(True, f"{path.rstrip(os.sep)}{os.sep}*", all_frames=True)
+            for path in self.include
+        ]
+        filters += [
+            tracemalloc.Filter(False, f"{path.rstrip(os.sep)}{os.sep}*")
+            for path in self.exclude
+        ]
+        # Never report the monitor's own bookkeeping
+        filters.append(tracemalloc.Filter(False, __file__, all_frames=True))
+        filters.append(tracemalloc.Filter(False, tracemalloc.__file__))
+        return filters
+
+    def sample(self):
+        """Take one snapshot and compare it with the previous one"""
+        if not tracemalloc.is_tracing():
+            return None
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters())
+
+        with self._lock:
+            previous, self._previous = self._previous, snapshot
+            self._samples += 1
+        if previous is None:
+            return None
+
+        # compare_to() is the slow part, keep it outside the lock so
+        # report() callers never wait for it
+        diff = snapshot.compare_to(previous, self.key_type)
+        entry = {
+            "timestamp": time.time(),
+            "total_size": sum(stat.size for stat in diff),
+            "size_diff": sum(stat.size_diff for stat in diff),
+            "top": [_stat_to_dict(stat) for stat in diff[: self.top]],
+        }
+
+        with self._lock:
+            self._update_streaks(diff)
+            self.history.append(entry)
+        return entry
+
+    def _update_streaks(self, diff):
+        # Sites missing from the diff or shrinking lose their streak
+        streaks = {}
+        for stat in diff:
+            if stat.size_diff <= 0:
+                continue
+            count, growth, _ = self._streaks.get(stat.traceback, (0, 0, None))
+            streaks[stat.traceback] = (count + 1, growth + stat.size_diff, stat)
+        self._streaks = streaks
+
+    def suspects(self):
+        """Allocation sites that grew in each of the last N intervals"""
+        with self._lock:
+            found = [
+                (count, growth, stat)
+                for count, growth, stat in self._streaks.values()
+                if count >= self.growth_intervals
+            ]
+
+        found.sort(key=lambda item: item[1], reverse=True)
+        return [
+            {**_stat_to_dict(stat), "intervals": count, "growth": growth}
+            for count, growth, stat in found
+        ]
+
+    def report(self):
+        """JSON-serializable view of the monitor state"""
+        with self._lock:
+            history = list(self.history)
+            samples = self._samples
+
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "frames": self.frames,
+            "growth_intervals": self.growth_intervals,
+            "samples": samples,
+            "suspects": self.suspects(),
+            "history": history,
+        }
+
+
+def _default_exclude(include):
+    paths = {sys.prefix, sys.base_prefix, sys.exec_prefix}
+    paths.update(sysconfig.get_path(name) for name in ("stdlib", "purelib", "platlib"))
+    # An app deployed inside the prefix (/usr/local/app) must stay visible
+    paths = [
+        path for path in sorted(paths)
+        if not any(os.path.commonpath([path, root]) == path for root in map(os.path.abspath, include))
+    ]
+    # Packages installed outside the prefix (user site, distro dist-packages)
+    return paths + [f"*{os.sep}site-packages", f"*{os.sep}dist-packages"]
+
+
+def _stat_to_dict(stat):
+    return {
+        "traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+        "size": stat.size,
+        "size_diff": stat.size_diff,
+        "count": stat.count,
+        "count_diff": stat.count_diff,
+    }
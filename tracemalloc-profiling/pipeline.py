@@ -0,0 +1,312 @@
+"""
+Lazy streaming pipelines
+
+`process_with_generator` keeps memory flat for one expression. Pipeline chains
+map/filter/batch/window stages that stay lazy end to end, optionally runs a
+stage in a thread or process pool with a bounded number of items in flight,
+and works with both regular and async sources.
+
+    pipeline = (
+        Pipeline(range(1_000_000))
+        .map(square)
+        .filter(is_even)
+        .batch(1000)
+        .map(save_batch, workers=4, max_in_flight=8)
+    )
+    for result in pipeline:
+        ...
+
+    # Async sources feed a FastAPI StreamingResponse directly
+    return StreamingResponse(Pipeline(read_rows()).map(to_csv_line))
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+class StageMetrics:
+    """Counters for one run of one stage"""
+
+    __slots__ = ("name", "items_in", "items_out", "in_flight", "max_in_flight", "started", "finished")
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.items_in = 0
+        self.items_out = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = None
+        self.finished = None
+
+    def as_dict(self):
+        end = self.finished or time.perf_counter()
+        elapsed = end - self.started if self.started is not None else 0.0
+        return {
+            "stage": self.name,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "seconds": round(elapsed, 6),
+            "items_per_second": round(self.items_out / elapsed, 1) if elapsed else 0.0,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+class Stage:
+    """One step of a pipeline, with a sync and an async implementation"""
+
+    def __init__(self, name):
+        self.name = name
+
+    # Stages are shared by derived pipelines and by concurrent runs, so the
+    # counters belong to the run, never to the stage
+    def run(self, items, metrics):
+        metrics.started = time.perf_counter()
+        yield from self.process(items, metrics)
+        metrics.finished = time.perf_counter()
+
+    async def arun(self, items, metrics):
+        metrics.started = time.perf_counter()
+        async for item in self.aprocess(items, metrics):
+            yield item
+        metrics.finished = time.perf_counter()
+
+    def process(self, items, metrics):
+        raise NotImplementedError
+
+    def aprocess(self, items, metrics):
+        raise NotImplementedError
+
+
+class MapStage(Stage):
+    def __init__(self, func):
+        super().__init__(f"map({_name(func)})")
+        self.func = func
+
+    def process(self, items, metrics):
+        func = self.func
+        for item in items:
+            metrics.items_in += 1
+            result = func(item)
+            metrics.items_out += 1
+            yield result
+
+    async def aprocess(self, items, metrics):
+        func = self.func
+        async for item in items:
+            metrics.items_in += 1
+            result = func(item)
+            metrics.items_out += 1
+            yield result
+
+
+class PoolMapStage(Stage):
+    """Map in a thread/process pool, never more than max_in_flight pending items"""
+
+    def __init__(self, func, workers, executor, max_in_flight):
+        super().__init__(f"map({_name(func)}, {executor}x{workers})")
+        if executor not in _EXECUTORS:
+            raise ValueError(f"executor must be one of {sorted(_EXECUTORS)}, got {executor!r}")
+        self.func = func
+        self.workers = workers
+        self.executor = executor
+        self.max_in_flight = max_in_flight or workers * 2
+
+    def process(self, items, metrics):
+        func = self.func
+        pending = deque()
+        with _EXECUTORS[self.executor](self.workers) as pool:
+            for item in items:
+                metrics.items_in += 1
+                pending.append(pool.submit(func, item))
+                self._track(metrics, len(pending))
+                # Results come back in input order; wait for the oldest when full
+                if len(pending) >= self.max_in_flight:
+                    yield self._pop(metrics, pending).result()
+            while pending:
+                yield self._pop(metrics, pending).result()
+
+    async def aprocess(self, items, metrics):
+        loop = asyncio.get_running_loop()
+        func = self.func
+        pending = deque()
+        pool = _EXECUTORS[self.executor](self.workers)
+        try:
+            async for item in items:
+                metrics.items_in += 1
+                pending.append(loop.run_in_executor(pool, func, item))
+                self._track(metrics, len(pending))
+                if len(pending) >= self.max_in_flight:
+                    yield await self._pop(metrics, pending)
+            while pending:
+                yield await self._pop(metrics, pending)
+        finally:
+            # Leaving the with-block would join the workers on the event loop;
+            # on cancel or aclose() drop queued work and let running calls finish alone
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _track(self, metrics, depth):
+        metrics.in_flight = depth
+        metrics.max_in_flight = max(metrics.max_in_flight, depth)
+
+    def _pop(self, metrics, pending):
+        future = pending.popleft()
+        metrics.in_flight = len(pending)
+        metrics.items_out += 1
+        return future
+
+
+class FilterStage(Stage):
+    def __init__(self, predicate):
+        super().__init__(f"filter({_name(predicate)})")
+        self.predicate = predicate
+
+    def process(self, items, metrics):
+        predicate = self.predicate
+        for item in items:
+            metrics.items_in += 1
+            if predicate(item):
+                metrics.items_out += 1
+                yield item
+
+    async def aprocess(self, items, metrics):
+        predicate = self.predicate
+        async for item in items:
+            metrics.items_in += 1
+            if predicate(item):
+                metrics.items_out += 1
+                yield item
+
+
+class BatchStage(Stage):
+    """Group items into lists of `size` (the last one may be shorter)"""
+
+    def __init__(self, size):
+        super().__init__(f"batch({size})")
+        self.size = size
+
+    def process(self, items, metrics):
+        iterator = iter(items)
+        while batch := list(islice(iterator, self.size)):
+            metrics.items_in += len(batch)
+            metrics.items_out += 1
+            yield batch
+
+    async def aprocess(self, items, metrics):
+        batch = []
+        async for item in items:
+            metrics.items_in += 1
+            batch.append(item)
+            if len(batch) == self.size:
+                metrics.items_out += 1
+                yield batch
+                batch = []
+        if batch:
+            metrics.items_out += 1
+            yield batch
+
+
+class WindowStage(Stage):
+    """Sliding windows of `size` items, advancing by `step`"""
+
+    def __init__(self, size, step):
+        super().__init__(f"window({size}, {step})")
+        self.size = size
+        self.step = step
+
+    def process(self, items, metrics):
+        window = deque(maxlen=self.size)
+        for item in items:
+            if (result := self._push(window, item, metrics)) is not None:
+                yield result
+
+    async def aprocess(self, items, metrics):
+        window = deque(maxlen=self.size)
+        async for item in items:
+            if (result := self._push(window, item, metrics)) is not None:
+                yield result
+
+    def _push(self, window, item, metrics):
+        metrics.items_in += 1
+        window.append(item)
+        seen = metrics.items_in - self.size
+        if seen >= 0 and seen % self.step == 0:
+            metrics.items_out += 1
+            return tuple(window)
+        return None
+
+
+class Pipeline:
+    """Composable lazy stages over a sync or async source"""
+
+    def __init__(self, source, stages=()):
+        self.source = source
+        self.stages = list(stages)
+        self._metrics = [StageMetrics(stage.name) for stage in self.stages]
+
+    def _then(self, stage):
+        # Each call returns a new pipeline, so partial pipelines can be reused
+        return Pipeline(self.source, [*self.stages, stage])
+
+    def map(self, func, workers=0, executor="thread", max_in_flight=None):
+        if workers:
+            return self._then(PoolMapStage(func, workers, executor, max_in_flight))
+        return self._then(MapStage(func))
+
+    def filter(self, predicate):
+        return self._then(FilterStage(predicate))
+
+    def batch(self, size):
+        if size < 1:
+            raise ValueError("batch size must be at least 1")
+        return self._then(BatchStage(size))
+
+    def window(self, size, step=1):
+        if size < 1 or step < 1:
+            raise ValueError("window size and step must be at least 1")
+        return self._then(WindowStage(size, step))
+
+    def __iter__(self):
+        if hasattr(self.source, "__aiter__"):
+            raise TypeError("async source, use 'async for' instead")
+        items = iter(self.source)
+        for stage, metrics in zip(self.stages, self._new_run()):
+            items = stage.run(items, metrics)
+        return items
+
+    def __aiter__(self):
+        items = _aiter_source(self.source)
+        for stage, metrics in zip(self.stages, self._new_run()):
+            items = stage.arun(items, metrics)
+        return items
+
+    def _new_run(self):
+        self._metrics = [StageMetrics(stage.name) for stage in self.stages]
+        return self._metrics
+
+    def metrics(self):
+        """Per-stage throughput and queue depth of this pipeline's latest run"""
+        return [metrics.as_dict() for metrics in self._metrics]
+
+
+async def _aiter_source(source):
+    if hasattr(source, "__aiter__"):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+def _name(func):
+    return getattr(func, "__name__", type(func).__name__)
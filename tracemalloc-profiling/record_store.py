@@ -0,0 +1,332 @@
+"""
+Compact columnar record store
+
+A list of 100,000 small dicts costs hundreds of bytes per row: one dict, one
+boxed int per number and one str object per name. RecordStore keeps one typed
+buffer per column instead and only creates Python objects when a row is read.
+"""
+
+import operator
+import sys
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # Pure Python fallback
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class StringColumn:
+    """Offset-encoded UTF-8 strings (Arrow 'large_string' layout)"""
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode()
+
+    def __iter__(self):
+        data, offsets = self.data, self.offsets
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end].decode()
+
+    def append(self, value):
+        self.data += value.encode()
+        self.offsets.append(len(self.data))
+
+    def truncate(self, length):
+        del self.data[self.offsets[length]:]
+        del self.offsets[length + 1:]
+
+    def take(self, indices):
+        subset = StringColumn()
+        data, offsets = self.data, self.offsets
+        # One slice per row, joined once: no per-byte index arrays
+        chunks = [data[offsets[i]:offsets[i + 1]] for i in indices]
+        subset.data = bytearray(b"".join(chunks))
+        subset.offsets.extend(accumulate(map(len, chunks)))
+        return subset
+
+    def buffers(self):
+        return {"offsets": memoryview(self.offsets), "data": memoryview(self.data)}
+
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class CategoryColumn:
+    """Interned strings: every distinct value is stored once, rows hold a code"""
+
+    __slots__ = ("codes", "values", "_lookup")
+
+    def __init__(self):
+        self.codes = array("l")
+        self.values = []
+        self._lookup = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+    def __iter__(self):
+        values = self.values
+        return (values[code] for code in self.codes)
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        self.codes.append(code)
+
+    def truncate(self, length):
+        # Values added by the dropped rows stay in the dictionary, unused
+        del self.codes[length:]
+
+    def take(self, indices):
+        subset = CategoryColumn()
+        codes = self.codes
+        subset.codes.extend(codes[i] for i in indices)
+        # Copied, appending to the subset must not grow our dictionary
+        subset.values = self.values.copy()
+        subset._lookup = self._lookup.copy()
+        return subset
+
+    def buffers(self):
+        return {"codes": memoryview(self.codes), "values": self.values}
+
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes) + sum(
+            sys.getsizeof(value) for value in self.values
+        )
+
+
+def _make_column(kind):
+    if kind is str:
+        return StringColumn()
+    if kind == "category":
+        return CategoryColumn()
+    return array(kind)
+
+
+def _make_row_class(columns):
+    """Build a __slots__ proxy with one read-only property per column"""
+
+    def column_property(column):
+        # The column is bound in the closure, a read is one index lookup
+        def get(self):
+            return column[self._index]
+        return property(get)
+
+    namespace = {name: column_property(column) for name, column in columns.items()}
+    namespace["__slots__"] = ("_store", "_index")
+    namespace["__init__"] = _row_init
+    namespace["__repr__"] = _row_repr
+    namespace["as_dict"] = _row_as_dict
+    return type("Row", (), namespace)
+
+
+def _row_init(self, store, index):
+    self._store = store
+    self._index = index
+
+
+def _row_repr(self):
+    return f"Row({self.as_dict()})"
+
+
+def _row_as_dict(self):
+    index = self._index
+    return {name: column[index] for name, column in self._store._columns.items()}
+
+
+class RecordStore:
+    """Typed columns instead of a list of dicts
+
+    The schema maps a column name to an array typecode ('q', 'd', ...),
+    `str` for offset-encoded strings or "category" for interned strings.
+    """
+
+    def __init__(self, schema):
+        self.schema = dict(schema)
+        self._columns = {name: _make_column(kind) for name, kind in self.schema.items()}
+        self._row_class = _make_row_class(self._columns)
+
+    @classmethod
+    def from_dicts(cls, schema, rows):
+        store = cls(schema)
+        store.extend(rows)
+        return store
+
+    def __len__(self):
+        return len(next(iter(self._columns.values()), ()))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return self._row_class(self, index)
+
+    def __iter__(self):
+        row_class = self._row_class
+        for index in range(len(self)):
+            yield row_class(self, index)
+
+    def append(self, row):
+        length = len(self)
+        try:
+            for name, column in self._columns.items():
+                column.append(row[name])
+        except BaseException:
+            self._truncate(length)
+            raise
+
+    def extend(self, rows):
+        """Append rows; a row with a bad value is dropped whole before raising"""
+        # Bind each column's append once instead of per row
+        appends = [(name, column.append) for name, column in self._columns.items()]
+        length = len(self)
+        try:
+            for row in rows:
+                for name, append in appends:
+                    append(row[name])
+                length += 1
+        except BaseException:
+            self._truncate(length)
+            raise
+
+    def _truncate(self, length):
+        # A value can fail halfway through a row (KeyError, TypeError, ...),
+        # drop what the earlier columns already took so they stay aligned
+        for column in self._columns.values():
+            if isinstance(column, array):
+                del column[length:]
+            else:
+                column.truncate(length)
+
+    def rows(self, *names):
+        """Iterate plain tuples, the fastest way to read many rows"""
+        return zip(*(self._columns[name] for name in names or self.schema))
+
+    def column(self, name):
+        """Zero-copy view of a numeric column (NumPy array when available)
+
+        The store cannot grow while the view is alive (append raises
+        BufferError), release it first.
+        """
+        column = self._columns[name]
+        if not isinstance(column, array):
+            raise TypeError(f"{name} is not a numeric column")
+        if np is not None:
+            return np.frombuffer(column, dtype=column.typecode)
+        return memoryview(column)
+
+    def where(self, name, op, value):
+        """Indices of the rows where `column <op> value` holds"""
+        compare = _OPERATORS[op]
+        column = self._columns[name]
+        if np is not None and isinstance(column, array):
+            return np.flatnonzero(compare(self.column(name), value))
+        return array("q", (i for i, item in enumerate(column) if compare(item, value)))
+
+    def take(self, indices):
+        """New store holding only the given rows"""
+        columns = {}
+        for name, column in self._columns.items():
+            if not isinstance(column, array):
+                columns[name] = column.take(indices)
+            elif np is not None:
+                selected = self.column(name)[np.asarray(indices, dtype=np.int64)]
+                columns[name] = array(column.typecode, selected.tobytes())
+            else:
+                columns[name] = array(column.typecode, (column[i] for i in indices))
+        return RecordStore._from_columns(self.schema, columns)
+
+    @classmethod
+    def _from_columns(cls, schema, columns):
+        store = cls.__new__(cls)
+        store.schema = dict(schema)
+        store._columns = columns
+        store._row_class = _make_row_class(columns)
+        return store
+
+    def filter(self, name, op, value):
+        return self.take(self.where(name, op, value))
+
+    def sum(self, name):
+        if np is not None:
+            return self.column(name).sum().item()
+        return sum(self._columns[name])
+
+    def min(self, name):
+        if np is not None:
+            return self.column(name).min().item()
+        return min(self._columns[name])
+
+    def max(self, name):
+        if np is not None:
+            return self.column(name).max().item()
+        return max(self._columns[name])
+
+    def mean(self, name):
+        if not len(self):
+            raise ValueError("mean of an empty store")
+        return self.sum(name) / len(self)
+
+    def to_buffers(self):
+        """Arrow-style buffers that share memory with the store
+
+        The store cannot grow while these views are alive, release them first.
+        """
+        return {
+            name: memoryview(column) if isinstance(column, array) else column.buffers()
+            for name, column in self._columns.items()
+        }
+
+    def to_json(self):
+        """Columnar JSON; orjson serializes numeric columns straight from the buffers"""
+        if orjson is None or np is None:
+            import json
+            payload = {name: list(column) for name, column in self._columns.items()}
+            return json.dumps(payload).encode()
+
+        payload = {
+            name: self.column(name) if isinstance(column, array) else list(column)
+            for name, column in self._columns.items()
+        }
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def nbytes(self):
+        """Bytes held by the column buffers"""
+        total = 0
+        for column in self._columns.values():
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += column.nbytes()
+        return total
@@ -0,0 +1,232 @@
+"""
+Bulk regex extraction
+
+Example 3 runs one re.search() per pattern per line. For log scraping with
+many patterns over big files, PatternSet compiles all patterns into a single
+alternation with one named group per pattern, scans memory-mapped files in
+large blocks (no per-line Python loop) and can fan blocks out to a process
+pool. Blocks always end on a line boundary and patterns that could match
+across lines are rejected, so every match is one a per-line search could find.
+"""
+
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+BLOCK_SIZE = 64 * 1024 * 1024
+
+_NAMED_GROUP = re.compile(r"\(\?P<(\w+)>")
+_NAMED_BACKREF = re.compile(r"\(\?P=(\w+)\)")
+_NUMBERED_BACKREF = re.compile(r"\\[1-9]")
+
+# Parsed categories that include "\n"
+_NEWLINE_CATEGORIES = {"CATEGORY_SPACE", "CATEGORY_NOT_DIGIT", "CATEGORY_NOT_WORD", "CATEGORY_LINEBREAK"}
+_REPEATS = {"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"}
+
+
+class PatternSet:
+    """Several regexes compiled into one `(?P<name>...)|(?P<name>...)` pattern
+
+    scan() yields (pattern name, offset, groups) where groups are the
+    pattern's own groups, like match.groups() would return for it alone.
+
+    Like any alternation, matches never overlap: at each offset the first
+    listed pattern that matches wins and scanning resumes after its match.
+    A pattern whose match overlaps an earlier one (say "user_id=(\\d+)" and
+    "id=(\\d+)") is not reported there; put such patterns in separate sets.
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = dict(patterns)
+        self._groups = {}
+
+        parts, index = [], 0
+        parsed = {name: sre_parse.parse(pattern, flags) for name, pattern in self.patterns.items()}
+        hoist_boundary = all(
+            _leading_boundary(pattern, parsed[name]) for name, pattern in self.patterns.items()
+        )
+        for name, pattern in self.patterns.items():
+            if not name.isidentifier():
+                raise ValueError(f"Pattern name must be an identifier, got {name!r}")
+            if _NUMBERED_BACKREF.search(pattern):
+                raise ValueError(f"{name}: use named backreferences, group numbers change when combined")
+            if (reason := _multiline_reason(parsed[name])):
+                raise ValueError(f"{name}: {reason}, matches must stay within one line")
+
+            # Inner named groups get the pattern name as a prefix to stay unique
+            pattern = _NAMED_GROUP.sub(rf"(?P<{name}__\1>", pattern)
+            pattern = _NAMED_BACKREF.sub(rf"(?P={name}__\1)", pattern)
+            inner = re.compile(pattern, flags).groups
+            # Slice of match.groups() holding this pattern's own groups
+            self._groups[name] = slice(index + 1, index + 1 + inner)
+            index += 1 + inner
+            # In verbose mode a trailing "# comment" would swallow our ")"
+            end = "\n" if parsed[name].state.flags & re.VERBOSE else ""
+            parts.append(f"(?P<{name}>{pattern[2:] if hoist_boundary else pattern}{end})")
+
+        combined = "|".join(parts)
+        if hoist_boundary:
+            # Checked once per offset instead of once per alternative, so
+            # offsets inside a word are rejected before trying any branch
+            combined = rf"\b(?:{combined})"
+
+        # A str pattern: \w, \d and \b follow Unicode like the per-line search
+        self.regex = re.compile(combined, flags | re.MULTILINE)
+
+    def scan(self, text, start=0, end=None):
+        """Every match in text[start:end], offsets are str indices"""
+        groups = self._groups
+        end = len(text) if end is None else end
+        for match in self.regex.finditer(text, start, end):
+            name = match.lastgroup
+            yield name, match.start(), match.groups()[groups[name]]
+
+    def scan_file(self, path, block_size=BLOCK_SIZE):
+        """Scan a UTF-8 file through mmap, one block (ending on a newline) at a time
+
+        Offsets are byte offsets into the file.
+        """
+        with open(path, "rb") as file, _map(file) as data:
+            for start, end in block_bounds(data, block_size):
+                yield from self._scan_block(data, start, end)
+
+    def scan_file_parallel(self, path, workers=None, block_size=BLOCK_SIZE, max_in_flight=None):
+        """Like scan_file(), with blocks scanned in a process pool, in order
+
+        At most max_in_flight blocks (default 2 per worker) are pending, so
+        results of a huge file never pile up in memory.
+        """
+        max_in_flight = max_in_flight or 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        with open(path, "rb") as file, _map(file) as data, ProcessPoolExecutor(workers) as pool:
+            try:
+                for bounds in block_bounds(data, block_size):
+                    pending.append(pool.submit(_scan_file_block, self, path, bounds))
+                    if len(pending) >= max_in_flight:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _scan_block(self, data, start, end):
+        # Blocks end after a newline, so no UTF-8 sequence is ever cut in two
+        text = data[start:end].decode()
+        if text.isascii():
+            # One byte per character, str offsets are byte offsets
+            for name, offset, values in self.scan(text):
+                yield name, start + offset, values
+            return
+
+        # Matches come in order, encode only the text between two of them
+        chars, position = 0, start
+        for name, offset, values in self.scan(text):
+            position += len(text[chars:offset].encode())
+            chars = offset
+            yield name, position, values
+
+
+def block_bounds(data, block_size=BLOCK_SIZE):
+    """(start, end) offsets of blocks of about block_size that end after a newline"""
+    size, start = len(data), 0
+    while start < size:
+        end = start + block_size
+        if end >= size:
+            end = size
+        else:
+            newline = data.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def _map(file):
+    # mmap refuses empty files, an empty bytes object scans the same way
+    if not file.seek(0, 2):
+        return memoryview(b"")
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _scan_file_block(patterns, path, bounds):
+    start, end = bounds
+    with open(path, "rb") as file, _map(file) as data:
+        return list(patterns._scan_block(data, start, end))
+
+
+def _leading_boundary(pattern, parsed):
+    """True if the \\b the pattern starts with applies to all of it
+
+    In r"\\bfoo|bar" it only belongs to the first branch, so it can't be
+    stripped and checked once for the whole set.
+    """
+    items = list(parsed)
+    return (
+        pattern.startswith(r"\b")
+        and bool(items)
+        and items[0][0].name == "AT"
+        and items[0][1].name == "AT_BOUNDARY"
+        and all(op.name != "BRANCH" for op, _ in items)
+    )
+
+
+def _multiline_reason(parsed):
+    """Why a parsed pattern could match differently in a block than in one line, or None"""
+    return _walk(parsed, bool(parsed.state.flags & re.DOTALL))
+
+
+def _walk(items, dotall):
+    for op, av in items:
+        op = op.name
+        if (
+            op == "LITERAL" and av == 10
+            or op == "NOT_LITERAL" and av != 10
+            or op == "IN" and _set_has_newline(av)
+        ):
+            return "can match a newline (for whitespace use [^\\S\\n] or [ \\t], not \\s)"
+        if op == "ANY" and dotall:
+            return "'.' with DOTALL can match a newline"
+        if op == "AT" and av.name in ("AT_BEGINNING_STRING", "AT_END_STRING"):
+            return r"\A and \Z mean block edges here (use ^ and $)"
+
+        if op in _REPEATS:
+            children = [(av[2], dotall)]
+        elif op == "SUBPATTERN":
+            _, add_flags, del_flags, child = av
+            children = [(child, (dotall or bool(add_flags & re.DOTALL)) and not del_flags & re.DOTALL)]
+        elif op == "BRANCH":
+            children = [(child, dotall) for child in av[1]]
+        elif op in ("ASSERT", "ASSERT_NOT"):
+            children = [(av[1], dotall)]
+        elif op == "ATOMIC_GROUP":
+            children = [(av, dotall)]
+        elif op == "GROUPREF_EXISTS":
+            children = [(child, dotall) for child in av[1:] if child is not None]
+        else:
+            children = []
+        for child, child_dotall in children:
+            if (reason := _walk(child, child_dotall)):
+                return reason
+    return None
+
+
+def _set_has_newline(items):
+    negate, found = False, False
+    for op, av in items:
+        op = op.name
+        if op == "NEGATE":
+            negate = True
+        elif op == "LITERAL":
+            found |= av == 10
+        elif op == "RANGE":
+            found |= av[0] <= 10 <= av[1]
+        elif op == "CATEGORY":
+            found |= av.name in _NEWLINE_CATEGORIES
+    return found != negate